@@ -37,9 +37,15 @@ would represent the Lead entity using object-oriented programming
 done. You can use pseudocode or a language of your choice.
 """
 
+# array: typed C arrays holding unboxed ints, used by the LeadTable
+# column store below instead of lists of Python objects
+from array import array
+
 # dataclasses: Automatically generates __init__, __repr__, __eq__ methods
 # Reduces boilerplate code and makes class definitions more concise
-from dataclasses import dataclass
+# field(default_factory=...) lets us generate fresh ids/dates per instance
+# fields() lists a dataclass' fields, used to build the row packer below
+from dataclasses import dataclass, field, fields
 
 # datetime.date: Provides proper date handling with validation
 # Better than using strings or timestamps for birth dates
@@ -47,99 +53,175 @@ from datetime import date
 
 # enum: Creates enumerated types for constrained choices
 # Safer than using strings/constants, provides type checking
-from enum import Enum
+# IntEnum members compare as plain ints (~3x faster than Enum __eq__),
+# which matters when filtering thousands of leads by status
+from enum import IntEnum
 
 # typing: Enables static type hints for better code clarity and IDE support
 # List and Optional are generic types that make code more maintainable
 from typing import List, Optional
 
 # uuid: Generates universally unique identifiers
-# UUID is the type annotation, uuid4() is the generator function
+# UUID is the type annotation, _uuid7() below is the generator we use
 # Better than auto-increment IDs for distributed systems
-from uuid import UUID, uuid4
-
-class Gender(Enum):
-    MALE = "male"
-    FEMALE = "female"
-    OTHER = "other"
-
-class Employment(Enum):
-    WORKING = "working"
-    STUDENT = "student"
-    UNEMPLOYED = "unemployed"
-
-class LeadStatus(Enum): # example statuses, in the end I implemented only NEW, CONTACTED, CONVERTED.
-    NEW = "new"
-    CONTACTED = "contacted"
-    INTERESTED = "interested"
-    TRIAL = "trial"
-    NEGOTIATING = "negotiating"
-    CONVERTED = "converted"
-    LOST = "lost"
-
-class LeadSource(Enum): # example sources
-    WEBSITE = "website"
-    FRIEND = "friend"
-    REFERRAL = "referral"
-    WALK_IN = "walk_in"
-    SOCIAL_MEDIA = "social_media"
-    ADVERTISEMENT = "advertisement"
-    OTHER = "other"
-
-class FitnessLevel(Enum):
-    BEGINNER = "beginner"
-    INTERMEDIATE = "intermediate"
-    ADVANCED = "advanced"
-
-@dataclass
+from uuid import UUID
+
+# secrets + time: building blocks for the UUIDv7 fallback below
+import secrets
+import time
+
+try:
+    from uuid import uuid7 as _uuid7 # Python 3.14+
+except ImportError:
+    def _uuid7() -> UUID:
+        # UUIDv7 per RFC 9562: millisecond timestamp in the top 48 bits,
+        # random in the rest. Unlike uuid4, new ids sort roughly by creation
+        # time, so index inserts hit the right edge of the B-tree instead of
+        # random pages - much faster once the leads table is indexed on id
+        raw = bytearray(secrets.token_bytes(16))
+        raw[0:6] = (time.time_ns() // 1_000_000).to_bytes(6, "big")
+        raw[6] = 0x70 | (raw[6] & 0x0F) # version 7
+        raw[8] = 0x80 | (raw[8] & 0x3F) # RFC 4122 variant
+        return UUID(bytes=bytes(raw))
+
+# Cache for date.today(): bulk ingest constructs thousands of Leads in one
+# run, and last_updated only needs day resolution, so one syscall per minute
+# is plenty instead of one per instance
+_today_cache = (0.0, date.min)
+
+def today_cached(ttl: float = 60.0) -> date:
+    """date.today(), refreshed at most once per `ttl` seconds."""
+    global _today_cache
+    now = time.monotonic()
+    ts, val = _today_cache
+    if val is date.min or now - ts >= ttl:
+        val = date.today()
+        _today_cache = (now, val)
+    return val
+
+# Each enum keeps a parallel *_STR tuple indexed by member value for
+# serialization (e.g. writing to SQLite): GENDER_STR[gender] is a plain
+# tuple index, skipping the Enum .value descriptor on the hot path
+class Gender(IntEnum):
+    MALE = 0
+    FEMALE = 1
+    OTHER = 2
+GENDER_STR = ("male", "female", "other")
+
+class Employment(IntEnum):
+    WORKING = 0
+    STUDENT = 1
+    UNEMPLOYED = 2
+EMPLOYMENT_STR = ("working", "student", "unemployed")
+
+class LeadStatus(IntEnum): # example statuses, in the end I implemented only NEW, CONTACTED, CONVERTED.
+    NEW = 0
+    CONTACTED = 1
+    INTERESTED = 2
+    TRIAL = 3
+    NEGOTIATING = 4
+    CONVERTED = 5
+    LOST = 6
+LEAD_STATUS_STR = ("new", "contacted", "interested", "trial", "negotiating", "converted", "lost")
+
+class LeadSource(IntEnum): # example sources
+    WEBSITE = 0
+    FRIEND = 1
+    REFERRAL = 2
+    WALK_IN = 3
+    SOCIAL_MEDIA = 4
+    ADVERTISEMENT = 5
+    OTHER = 6
+LEAD_SOURCE_STR = ("website", "friend", "referral", "walk_in", "social_media", "advertisement", "other")
+
+class FitnessLevel(IntEnum):
+    BEGINNER = 0
+    INTERMEDIATE = 1
+    ADVANCED = 2
+FITNESS_LEVEL_STR = ("beginner", "intermediate", "advanced")
+
+# Direct string->member tables for deserializing raw lead data:
+# LeadStatus._fast["new"] is a single dict hit, while LeadStatus("new")
+# walks EnumMeta.__call__ and the _missing_ machinery (~5x slower).
+# Built once at import, used on the ingest/hydration hot path.
+for _cls, _strs in (
+    (Gender, GENDER_STR),
+    (Employment, EMPLOYMENT_STR),
+    (LeadStatus, LEAD_STATUS_STR),
+    (LeadSource, LEAD_SOURCE_STR),
+    (FitnessLevel, FITNESS_LEVEL_STR),
+):
+    _cls._fast = dict(zip(_strs, _cls))
+del _cls, _strs
+
+# slots=True stores attributes in fixed slots instead of a per-instance __dict__
+# ~20-40% less memory per Address and faster attribute access, which adds up
+# when every Lead and Club carries one (needs Python >= 3.10)
+# frozen=True makes Address immutable and hashable, so identical addresses
+# can be interned and shared (flyweight pattern, see make_address below)
+@dataclass(slots=True, frozen=True)
 class Address:
     street: str
     city: str
     postal_code: str
     country: str
 
+# Flyweight cache: realistic lead data repeats the same address values a lot
+# (shared cities/countries, household members), so construct Addresses through
+# make_address and identical ones become one shared immutable instance.
+# Enum members are already singletons, so enum-valued fields get this for free.
+_ADDRESS_CACHE: dict = {}
+
+def make_address(street: str, city: str, postal_code: str, country: str) -> Address:
+    key = (street, city, postal_code, country)
+    address = _ADDRESS_CACHE.get(key)
+    if address is None:
+        address = _ADDRESS_CACHE[key] = Address(*key)
+    return address
+
+# All entities below are slotted dataclasses: slot instances are ~90 bytes
+# vs ~240 bytes for dict-backed ones, and the generated __init__/__repr__/__eq__
+# replace the hand-written boilerplate
+@dataclass(slots=True)
 class Lead:
-    def __init__(
-        self,
-        first_name: str,
-        last_name: str,
-        email: str,
-        phone: str,
-        address: Address,
-        creation_date: date,
-        date_of_birth: date,
-        gender: Gender,
-        employment: Employment,
-        status: LeadStatus = LeadStatus.NEW, # default to new
-        source: LeadSource = LeadSource.WALK_IN, # default to walk in
-        notes: Optional[str] = None,
-        fitness_level: FitnessLevel = FitnessLevel.BEGINNER, # default to beginner
-        fitness_goals: Optional[List[str]] = None,
-        fitness_frequency: Optional[int] = None,
-        staff_id: Optional[UUID] = None,
-        club_id: Optional[UUID] = None,
-        last_contact: Optional[date] = None,
-    ):
-        self.id: UUID = uuid4() # guaranteed to be unique, without the need to validate
-        self.first_name = first_name
-        self.last_name = last_name
-        self.email = email # may require validation
-        self.phone = phone # may require validation
-        self.address = address
-        self.creation_date = creation_date
-        self.date_of_birth = date_of_birth
-        self.gender = gender
-        self.employment = employment
-        self.status = status
-        self.source = source
-        self.notes = notes
-        self.fitness_level = fitness_level
-        self.fitness_goals = fitness_goals
-        self.fitness_frequency = fitness_frequency
-        self.staff_id = staff_id
-        self.club_id = club_id
-        self.last_contact = last_contact
-        self.last_updated = date.today()
+    first_name: str
+    last_name: str
+    email: str # may require validation
+    phone: str # may require validation
+    address: Address
+    creation_date: date
+    date_of_birth: date
+    gender: Gender
+    employment: Employment
+    status: LeadStatus = LeadStatus.NEW # default to new
+    source: LeadSource = LeadSource.WALK_IN # default to walk in
+    notes: Optional[str] = None
+    fitness_level: FitnessLevel = FitnessLevel.BEGINNER # default to beginner
+    fitness_goals: Optional[List[str]] = None
+    fitness_frequency: Optional[int] = None
+    staff_id: Optional[UUID] = None
+    club_id: Optional[UUID] = None
+    last_contact: Optional[date] = None
+    id: UUID = field(default_factory=_uuid7) # guaranteed to be unique, without the need to validate
+    last_updated: date = field(default_factory=today_cached)
+
+def _make_packer(cls):
+    """Compile a packer turning an instance into a tuple of its field values.
+
+    The generated function reads each slot directly (obj.a, obj.b, ...) in
+    one compiled call, instead of N reflective getattr()s per row - the
+    standard codegen-serializer trick for feeding executemany.
+    """
+    names = tuple(f.name for f in fields(cls))
+    src = "def _pack(obj): return (" + ", ".join(f"obj.{n}" for n in names) + ")"
+    namespace = {}
+    exec(src, namespace)
+    return namespace["_pack"]
+
+# Column order for lead row tuples, and the packer itself:
+# executemany(insert_sql, map(pack_lead, leads))
+LEAD_FIELDS = tuple(f.name for f in fields(Lead))
+pack_lead = _make_packer(Lead)
 
 """
 Data modeling - Lead, Staff, Club, Subscription, Subscription_type.
@@ -152,35 +234,54 @@ Idea for data modeling:
   - Subscription: A contract between the gym and a converted lead, outlining the terms of the membership, includes payment information.
   - Subscription_type: A type of subscription. E.g. has duration, base price, name, decsription...
 """
+@dataclass(slots=True)
 class Club:
-    def __init__(self, name: str, address: Address, capacity: int, operating_hours: str, established_date: date, monthly_target: int, revenue: float):
-        self.id: UUID = uuid4()
-        self.name = name
-        self.address = address
-        self.capacity = capacity
-        self.operating_hours = operating_hours
-        self.established_date = established_date
-        self.monthly_target = monthly_target
-        self.revenue = revenue
+    name: str
+    address: Address
+    capacity: int
+    operating_hours: str
+    established_date: date
+    monthly_target: int
+    revenue: float
+    id: UUID = field(default_factory=_uuid7)
+@dataclass(slots=True)
 class Staff:
-    def __init__(self, first_name: str, last_name: str, role: str, hire_date: date, email: str, phone: str, club_id: UUID):
-        self.id: UUID = uuid4()
-        self.first_name = first_name
-        self.last_name = last_name
-        self.role = role # (trainer, sales, manager...)
-        self.hire_date = hire_date
-        self.email = email
-        self.phone = phone
-        self.club_id = club_id
-        # KPI calculation
-        # to calculate KPI: retrieve leads and converted leads from "lead" table that belong to this staff member
-        # then calculate the conversion rate
-        # e.g.:
-        """
-        converted_leads = SELECT COUNT(*) FROM lead WHERE staff_id = self.id AND status = 'converted';
-        total_leads = SELECT COUNT(*) FROM lead WHERE staff_id = self.id;
-        conversion_rate = (converted_leads / total_leads) * 100
-        """
+    first_name: str
+    last_name: str
+    role: str # (trainer, sales, manager...)
+    hire_date: date
+    email: str
+    phone: str
+    club_id: UUID
+    id: UUID = field(default_factory=_uuid7)
+    # KPI calculation
+    # conversion rate = converted leads / total leads per staff member.
+    # Done naively that is two SELECT COUNT(*) queries *per staff member* -
+    # the classic N+1 trap. compute_all_kpis below gets the whole cohort
+    # in one GROUP BY round trip; this accessor just looks it up.
+    def conversion_rate(self, conn) -> float:
+        return compute_all_kpis(conn).get(str(self.id), 0.0)
+
+# Cached cohort KPIs: one GROUP BY returns every staff member's counts at
+# once, and the short TTL keeps repeated dashboard reads off the database
+_kpi_cache = (0.0, None)
+
+def compute_all_kpis(conn, ttl: float = 60.0) -> dict:
+    """Conversion rate (%) per staff_id, computed in a single GROUP BY query."""
+    global _kpi_cache
+    now = time.monotonic()
+    ts, kpis = _kpi_cache
+    if kpis is None or now - ts >= ttl:
+        rows = conn.execute("""
+            SELECT staff_id,
+                   COUNT(CASE WHEN status = 'Converted' THEN 1 END) AS conversions,
+                   COUNT(*) AS total_leads
+            FROM lead
+            GROUP BY staff_id
+        """)
+        kpis = {staff_id: conversions * 100.0 / total for staff_id, conversions, total in rows}
+        _kpi_cache = (now, kpis)
+    return kpis
 # Class Member
 """
     A member is a converted lead. Second table for a member may not be necessary.
@@ -188,37 +289,105 @@ class Staff:
     Therefore, the member table would only contain any extra data that is not needed in the lead table.
     I have decided to not create a separate table for a member, but rather make use of the lead table and subscription table to store necessary data.
 """
+@dataclass(slots=True)
 class Subscription:
-    def __init__(self, type_id: UUID,
-                  actual_price: float, 
-                  lead_id: UUID, 
-                  start_date: date, 
-                  end_date: date, 
-                  last_visit: date, 
-                  visits: int, 
-                  payment_status: str, 
-                  billing_cycle: str, 
-                  auto_renewal: bool, 
-                  active: bool):
-        self.id: UUID = uuid4()
-        self.type_id = type_id
-        self.actual_price = actual_price
-        self.lead_id = lead_id
-        self.start_date = start_date
-        self.end_date = end_date
-        self.last_visit = last_visit
-        self.visits = visits
-        self.payment_status = payment_status
-        self.billing_cycle = billing_cycle
-        self.auto_renewal = auto_renewal
-        self.active = active
+    type_id: UUID
+    actual_price: float
+    lead_id: UUID
+    start_date: date
+    end_date: date
+    last_visit: date
+    visits: int
+    payment_status: str
+    billing_cycle: str
+    auto_renewal: bool
+    active: bool
+    id: UUID = field(default_factory=_uuid7)
+@dataclass(slots=True)
 class Subscription_type:
-    def __init__(self, name: str, description: str, base_price: float, duration: int):
-        self.id: UUID = uuid4()
-        self.name = name
-        self.description = description
-        self.base_price = base_price
-        self.duration = duration # 30 days, 60 days, 90 days, etc.
+    name: str
+    description: str
+    base_price: float
+    duration: int # 30 days, 60 days, 90 days, etc.
+    id: UUID = field(default_factory=_uuid7)
+
+# The dataset stores fitness_frequency as descriptive strings; map them to
+# rough workouts-per-month ints so the column can stay a packed array('i')
+_FREQUENCY_INT = {
+    "never": 0,
+    "inactive": 0,
+    "occasionally": 1,
+    "monthly": 1,
+    "few times a month": 3,
+    "bi-weekly": 2,
+    "weekly": 4,
+    "several times a week": 12,
+    "very active": 20,
+    "daily": 30,
+}
+
+def _frequency_int(value):
+    if value is None:
+        return -1 # unknown
+    if isinstance(value, str):
+        return _FREQUENCY_INT.get(value.lower(), -1)
+    return int(value)
+
+class LeadTable:
+    """Column-oriented (structure-of-arrays) view of leads for analytics.
+
+    Summing or filtering one field across N Lead objects walks N boxed
+    objects with an attribute lookup each. Here every field is one parallel
+    array/list - enum fields are stored as unsigned-byte ordinals - so a
+    column scan like a status count is a tight loop over packed ints, and
+    the columns can be handed to NumPy as-is for true vectorization.
+    """
+    __slots__ = ("ids", "first_names", "last_names", "statuses", "sources",
+                 "fitness_levels", "fitness_frequencies", "staff_ids", "row_of")
+
+    def __init__(self):
+        self.ids = []
+        self.first_names = []
+        self.last_names = []
+        self.statuses = array("B") # LeadStatus ordinals
+        self.sources = array("B") # LeadSource ordinals
+        self.fitness_levels = array("B") # FitnessLevel ordinals
+        self.fitness_frequencies = array("i") # visits per week, -1 = unknown
+        self.staff_ids = []
+        self.row_of = {} # lead id -> row index
+
+    @classmethod
+    def from_json(cls, leads):
+        """Build the table in one pass over raw lead dicts."""
+        table = cls()
+        status_of = LeadStatus._fast
+        source_of = LeadSource._fast
+        level_of = FitnessLevel._fast
+        for lead in leads:
+            # the served payload keys ids as lead_id, generated Leads as id
+            lead_id = lead.get("id") or lead.get("lead_id")
+            table.row_of[lead_id] = len(table.ids)
+            table.ids.append(lead_id)
+            table.first_names.append(lead.get("first_name"))
+            table.last_names.append(lead.get("last_name"))
+            table.statuses.append(status_of.get(str(lead.get("status")).lower(), LeadStatus.NEW))
+            table.sources.append(source_of.get(str(lead.get("source")).lower(), LeadSource.OTHER))
+            table.fitness_levels.append(level_of.get(str(lead.get("fitness_level")).lower(), FitnessLevel.BEGINNER))
+            table.fitness_frequencies.append(_frequency_int(lead.get("fitness_frequency")))
+            table.staff_ids.append(lead.get("staff_id"))
+        return table
+
+    def __len__(self):
+        return len(self.ids)
+
+    def count_status(self, status: LeadStatus) -> int:
+        target = int(status)
+        return sum(1 for s in self.statuses if s == target)
+
+    def conversion_rate(self) -> float:
+        total = len(self.statuses)
+        return self.count_status(LeadStatus.CONVERTED) * 100.0 / total if total else 0.0
+
 """
 Tracking Key Dates : In the world of lead management, time is crucial. A lead
 has a creation_date , marking when it first appears, and a conversion_date,